@@ -1,4 +1,7 @@
+import asyncio
+import copy
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional
 
 import asyncpg
@@ -9,12 +12,11 @@ from app.config import get_settings
 settings = get_settings()
 
 
-# Tortoise ORM configuration for Aerich
-def get_tortoise_orm_config() -> dict:
-    """Get Tortoise ORM config with current settings"""
+@lru_cache(maxsize=1)
+def _build_tortoise_orm_config(core_database_url: str) -> dict:
     return {
         "connections": {
-            "default": settings.core_database_url,
+            "default": core_database_url,
         },
         "apps": {
             "models": {
@@ -25,6 +27,16 @@ def get_tortoise_orm_config() -> dict:
     }
 
 
+# Tortoise ORM configuration for Aerich
+def get_tortoise_orm_config() -> dict:
+    """
+    Get Tortoise ORM config with current settings
+    Built once per database URL, so get_settings.cache_clear() is enough to pick up
+    changed settings; each caller gets its own copy and may mutate it
+    """
+    return copy.deepcopy(_build_tortoise_orm_config(get_settings().core_database_url))
+
+
 TORTOISE_ORM = get_tortoise_orm_config()
 
 
@@ -54,6 +66,8 @@ class DatabaseManager:
     _instance: Optional["DatabaseManager"] = None
     _tenant_connections: dict[str, bool] = {}
     _core_initialized: bool = False
+    _admin_pool: asyncpg.Pool | None = None
+    _admin_pool_lock: asyncio.Lock | None = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -135,6 +149,29 @@ class DatabaseManager:
         """Get connection name for tenant"""
         return f"tenant_{tenant_id}"
 
+    async def get_admin_pool(self) -> asyncpg.Pool:
+        """
+        Get shared pool of connections to the "postgres" maintenance database
+        Created lazily and reused for tenant database provisioning
+        """
+        if self._admin_pool is None:
+            # Concurrent first callers must not each create (and leak) a pool. The lock is
+            # made here, not at import, so it belongs to the loop that creates the pool
+            if self._admin_pool_lock is None:
+                self._admin_pool_lock = asyncio.Lock()
+            async with self._admin_pool_lock:
+                if self._admin_pool is None:
+                    self._admin_pool = await asyncpg.create_pool(
+                        host=settings.TENANT_DB_HOST,
+                        port=settings.TENANT_DB_PORT,
+                        user=settings.TENANT_DB_USER,
+                        password=settings.TENANT_DB_PASSWORD,
+                        database="postgres",
+                        min_size=1,
+                        max_size=2,
+                    )
+        return self._admin_pool
+
     async def create_tenant_database(self, tenant_id: str) -> bool:
         """
         Creates a new PostgreSQL database for a tenant
@@ -143,21 +180,15 @@ class DatabaseManager:
         db_name = f"tenant_{tenant_id}"
 
         try:
-            conn = await asyncpg.connect(
-                host=settings.TENANT_DB_HOST,
-                port=settings.TENANT_DB_PORT,
-                user=settings.TENANT_DB_USER,
-                password=settings.TENANT_DB_PASSWORD,
-                database="postgres",
-            )
-
-            # Check if database exists
-            exists = await conn.fetchval("SELECT 1 FROM pg_database WHERE datname = $1", db_name)
-
-            if not exists:
-                await conn.execute(f'CREATE DATABASE "{db_name}"')
+            pool = await self.get_admin_pool()
+            async with pool.acquire() as conn:
+                # Check if database exists
+                exists = await conn.fetchval(
+                    "SELECT 1 FROM pg_database WHERE datname = $1", db_name
+                )
 
-            await conn.close()
+                if not exists:
+                    await conn.execute(f'CREATE DATABASE "{db_name}"')
 
             # Initialize tenant database with schema
             await self.init_tenant_db(tenant_id)
@@ -196,6 +227,10 @@ class DatabaseManager:
     async def close_all(self):
         """Close all database connections"""
         await Tortoise.close_connections()
+        if self._admin_pool is not None:
+            await self._admin_pool.close()
+            self._admin_pool = None
+        self._admin_pool_lock = None
         self._tenant_connections.clear()
         self._core_initialized = False
 
@@ -1,4 +1,8 @@
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, cast
 from uuid import UUID
@@ -17,14 +21,16 @@ logging.getLogger("passlib.handlers.bcrypt").setLevel(logging.ERROR)
 class PasswordHasher:
     """Password hashing utilities using bcrypt"""
 
-    @staticmethod
-    def hash_password(password: str) -> str:
+    _rounds = 12
+
+    @classmethod
+    def hash_password(cls, password: str) -> str:
         """Hash a password using bcrypt, truncating to 72 bytes if needed."""
         password_bytes = password.encode("utf-8")
         if len(password_bytes) > 72:
             password_bytes = password_bytes[:72]
 
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=cls._rounds)
         hashed = bcrypt.hashpw(password_bytes, salt)
         return cast(str, hashed.decode("utf-8"))
 
@@ -40,6 +46,29 @@ class PasswordHasher:
         return cast(bool, bcrypt.checkpw(password_bytes, hashed_bytes))
 
 
+_VERIFIED_TOKENS_MAX = 1024
+# Keyed by a token digest so live credentials are never held in memory
+_verified_tokens: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
+
+def _verify_token(token: str) -> dict[str, Any]:
+    """Verify signature and claims once per token; failures are not cached"""
+    digest = hashlib.sha256(token.encode("utf-8")).digest()[:16]
+    with _verified_tokens_lock:
+        payload = _verified_tokens.get(digest)
+        if payload is not None:
+            _verified_tokens.move_to_end(digest)
+            return payload
+
+    payload = dict(jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]))
+    with _verified_tokens_lock:
+        _verified_tokens[digest] = payload
+        if len(_verified_tokens) > _VERIFIED_TOKENS_MAX:
+            _verified_tokens.popitem(last=False)
+    return payload
+
+
 class TokenScope:
     CORE = "core"
     TENANT = "tenant"
@@ -137,12 +166,16 @@ class JWTHandler:
             AuthenticationError: If token is invalid or expired
         """
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            # jwt.decode returns dict[str, Any]
-            return dict(payload)
+            payload = _verify_token(token)
         except JWTError as e:
             raise AuthenticationError(f"Invalid token: {str(e)}") from e
 
+        # A cached payload can outlive its token, so expiry is re-checked on every call
+        exp = payload.get("exp")
+        if exp is not None and exp <= time.time():
+            raise AuthenticationError("Invalid token: Signature has expired.")
+        return dict(payload)
+
     @staticmethod
     def get_token_payload(token: str) -> dict[str, Any]:
         """
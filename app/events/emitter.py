@@ -18,6 +18,7 @@ class EventType:
 class EventEmitter:
     def __init__(self) -> None:
         self._listeners: dict[str, list[EventHandler]] = defaultdict(list)
+        self._pending_tasks: set[asyncio.Task[None]] = set()
 
     def on(self, event_type: str, handler: EventHandler) -> None:
         self._listeners[event_type].append(handler)
@@ -46,6 +47,27 @@ class EventEmitter:
             return_exceptions=True,
         )
 
+    def emit_in_background(
+        self, event_type: str, data: dict[str, Any] | None = None
+    ) -> asyncio.Task[None]:
+        # Keep a reference so the task is not garbage collected before it finishes
+        task = asyncio.create_task(self.emit(event_type, data))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        return task
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """Wait for background emits to finish, cancelling any still running after timeout"""
+        if not self._pending_tasks:
+            return
+
+        _, pending = await asyncio.wait(set(self._pending_tasks), timeout=timeout)
+        if pending:
+            logger.warning("Cancelling unfinished event tasks", extra={"count": len(pending)})
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _safe_execute(
         self, handler: EventHandler, event_type: str, data: dict[str, Any]
     ) -> None:
@@ -5,12 +5,16 @@ from fastapi import FastAPI
 from app.api.v1 import auth, organizations, users
 from app.config import get_settings
 from app.core.database import db_manager
+from app.events.emitter import event_emitter
 from app.events.handlers import register_handlers
 from app.middleware.logging import setup_logging
 from app.middleware.tenant_context import TenantContextMiddleware
 
 settings = get_settings()
 
+# Seconds to let in-flight event handlers finish on shutdown
+EVENT_DRAIN_TIMEOUT = 5.0
+
 # Setup logging
 setup_logging(level="INFO" if not settings.DEBUG else "DEBUG")
 
@@ -26,6 +30,8 @@ async def lifespan(app: FastAPI):
     """
     await db_manager.init_core_db()
     yield
+    # Handlers may still need the database, so let them finish before closing it
+    await event_emitter.drain(timeout=EVENT_DRAIN_TIMEOUT)
     await db_manager.close_all()
 
 
@@ -1,6 +1,7 @@
 from typing import Generic, TypeVar, cast
 from uuid import UUID
 
+from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.exceptions import DoesNotExist
 from tortoise.models import Model
 
@@ -16,10 +17,13 @@ class BaseRepository(Generic[ModelType]):
     def __init__(self, model: type[ModelType]):
         self.model = model
 
-    async def get_by_id(self, id: UUID) -> ModelType | None:
-        """Get entity by ID"""
+    async def get_by_id(self, id: UUID, prefetch: tuple[str, ...] = ()) -> ModelType | None:
+        """Get entity by ID, optionally prefetching related fields"""
+        query = self.model.get(id=id)
+        if prefetch:
+            query = query.prefetch_related(*prefetch)
         try:
-            return cast(ModelType, await self.model.get(id=id))
+            return cast(ModelType, await query)
         except DoesNotExist:
             return None
 
@@ -45,8 +49,23 @@ class BaseRepository(Generic[ModelType]):
         """Update entity by ID"""
         instance = await self.get_by_id(id)
         if instance:
-            await instance.update_from_dict(data)
-            await instance.save()
+            await self.update_instance(instance, **data)
+        return instance
+
+    async def update_instance(
+        self, instance: ModelType, using_db: BaseDBAsyncClient | None = None, **data
+    ) -> ModelType:
+        """
+        Update an already loaded entity without fetching it again
+        Only the given fields (plus updated_at, if the model has it) are written
+        """
+        await instance.update_from_dict(data)
+        fields_map = instance._meta.fields_map
+        update_fields = [field for field in data if field in fields_map]
+        # auto_now is only applied to fields listed in update_fields
+        if "updated_at" in fields_map and "updated_at" not in update_fields:
+            update_fields.append("updated_at")
+        await instance.save(using_db=using_db, update_fields=update_fields)
         return instance
 
     async def delete(self, id: UUID) -> bool:
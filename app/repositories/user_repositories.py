@@ -1,3 +1,4 @@
+from typing import Any, cast
 from uuid import UUID
 
 from app.models.core import User
@@ -15,6 +16,13 @@ class UserRepository(BaseRepository[User]):
         """Get user by email"""
         return await self.get_by_field(email=email)
 
+    async def get_contact_fields(self, user_id: UUID) -> dict[str, Any] | None:
+        """Get only id, email and full_name of user"""
+        return cast(
+            dict[str, Any] | None,
+            await self.model.filter(id=user_id).first().values("id", "email", "full_name"),
+        )
+
     async def create_user(
         self, email: str, hashed_password: str, full_name: str | None = None
     ) -> User:
@@ -1,4 +1,5 @@
 import re
+from operator import attrgetter
 from typing import Any
 from uuid import UUID
 
@@ -10,10 +11,22 @@ from app.core.exceptions import (
 )
 from app.core.utils import format_datetime
 from app.events.emitter import EventType, event_emitter
-from app.models.core import Organization, User
+from app.models.core import Organization
 from app.repositories.organization_repository import OrganizationRepository
 from app.repositories.user_repositories import UserRepository
 
+_ORG_KEYS = (
+    "id",
+    "name",
+    "slug",
+    "database_name",
+    "owner_id",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+_ORG_GETTER = attrgetter(*_ORG_KEYS)
+
 
 class OrganizationService:
     """Service for organization management"""
@@ -34,6 +47,16 @@ class OrganizationService:
     def generate_database_name(org_id: str) -> str:
         return f"tenant_{org_id}"
 
+    @staticmethod
+    def _serialize_org(organization: Organization) -> dict[str, Any]:
+        """Build organization response data"""
+        data = dict(zip(_ORG_KEYS, _ORG_GETTER(organization), strict=True))
+        data["id"] = str(data["id"])
+        data["owner_id"] = str(data["owner_id"])
+        data["created_at"] = format_datetime(data["created_at"])
+        data["updated_at"] = format_datetime(data["updated_at"])
+        return data
+
     async def create_organization(
         self, name: str, owner_id: UUID, slug: str | None = None
     ) -> dict[str, Any]:
@@ -53,7 +76,7 @@ class OrganizationService:
             ConflictError: If organization with name/slug already exists
             DatabaseError: If tenant database creation fails
         """
-        owner = await self.user_repo.get_by_id(owner_id)
+        owner = await self.user_repo.get_contact_fields(owner_id)
         if not owner:
             raise NotFoundError("User", str(owner_id))
 
@@ -97,36 +120,25 @@ class OrganizationService:
 
         await self._sync_owner_to_tenant(tenant_id, owner)
 
-        await event_emitter.emit(
+        event_emitter.emit_in_background(
             EventType.ORGANIZATION_CREATED,
             {
                 "organization_id": str(organization.id),
                 "organization_name": organization.name,
-                "owner_id": str(owner.id),
-                "owner_email": owner.email,
+                "owner_id": str(owner["id"]),
+                "owner_email": owner["email"],
             },
         )
 
-        return {
-            "id": str(organization.id),
-            "name": organization.name,
-            "slug": organization.slug,
-            "database_name": organization.database_name,
-            "owner_id": str(owner_id),
-            "is_active": organization.is_active,
-            "created_at": format_datetime(organization.created_at),
-            "updated_at": (
-                format_datetime(organization.updated_at) if organization.updated_at else None
-            ),
-        }
-
-    async def _sync_owner_to_tenant(self, tenant_id: str, owner: User) -> None:
+        return self._serialize_org(organization)
+
+    async def _sync_owner_to_tenant(self, tenant_id: str, owner: dict[str, Any]) -> None:
         """
         Sync organization owner to tenant database as owner user
 
         Args:
             tenant_id: Tenant/organization ID
-            owner: Owner user object
+            owner: Owner contact fields (email, full_name)
         """
         await db_manager.init_tenant_db(tenant_id)
 
@@ -137,7 +149,7 @@ class OrganizationService:
         connection_name = db_manager.get_tenant_connection_name(tenant_id)
         conn = Tortoise.get_connection(connection_name)
 
-        existing_owner = await TenantUser.filter(email=owner.email).using_db(conn).first()
+        existing_owner = await TenantUser.filter(email=owner["email"]).using_db(conn).first()
 
         if not existing_owner:
             from app.core.security import hash_password
@@ -145,9 +157,9 @@ class OrganizationService:
             default_password = hash_password("changeme123")
 
             tenant_user = TenantUser(
-                email=owner.email,
+                email=owner["email"],
                 hashed_password=default_password,
-                full_name=owner.full_name,
+                full_name=owner["full_name"],
                 is_owner=True,
                 is_active=True,
             )
@@ -158,33 +170,12 @@ class OrganizationService:
         if not organization:
             raise NotFoundError("Organization", str(org_id))
 
-        return {
-            "id": str(organization.id),
-            "name": organization.name,
-            "slug": organization.slug,
-            "database_name": organization.database_name,
-            "owner_id": str(organization.owner_id),
-            "is_active": organization.is_active,
-            "created_at": format_datetime(organization.created_at),
-            "updated_at": format_datetime(organization.updated_at),
-        }
+        return self._serialize_org(organization)
 
     async def get_organizations_by_owner(self, owner_id: UUID) -> list[dict[str, Any]]:
         organizations = await self.org_repo.get_by_owner(owner_id)
 
-        return [
-            {
-                "id": str(org.id),
-                "name": org.name,
-                "slug": org.slug,
-                "database_name": org.database_name,
-                "owner_id": str(org.owner_id),
-                "is_active": org.is_active,
-                "created_at": format_datetime(org.created_at),
-                "updated_at": (format_datetime(org.updated_at) if org.updated_at else None),
-            }
-            for org in organizations
-        ]
+        return [self._serialize_org(org) for org in organizations]
 
 
 organization_service = OrganizationService()
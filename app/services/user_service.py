@@ -18,30 +18,48 @@ class UserService:
         self.user_repo = UserRepository()
         self.tenant_user_repo = TenantUserRepository()
 
-    async def get_core_user_profile(self, user_id: UUID) -> dict[str, Any]:
-        user = await self.user_repo.get_by_id(user_id)
+    async def get_core_user_profile(
+        self, user_id: UUID, include_orgs: bool = True
+    ) -> dict[str, Any]:
+        """
+        Get core user profile
+
+        Args:
+            user_id: User UUID
+            include_orgs: Whether to load and include owned organizations
+
+        Returns:
+            Dictionary with user profile data
+
+        Raises:
+            NotFoundError: If user doesn't exist
+        """
+        prefetch = ("owned_organizations",) if include_orgs else ()
+        user = await self.user_repo.get_by_id(user_id, prefetch=prefetch)
         if not user:
             raise NotFoundError("User", str(user_id))
 
-        owned_orgs = await user.owned_organizations.all()
-
-        return {
+        profile: dict[str, Any] = {
             "id": str(user.id),
             "email": user.email,
             "full_name": user.full_name,
             "is_active": user.is_active,
             "created_at": format_datetime(user.created_at),
             "updated_at": format_datetime(user.updated_at),
-            "owned_organizations": [
+        }
+
+        if include_orgs:
+            profile["owned_organizations"] = [
                 {
                     "id": str(org.id),
                     "name": org.name,
                     "slug": org.slug,
                     "is_active": org.is_active,
                 }
-                for org in owned_orgs
-            ],
-        }
+                for org in user.owned_organizations
+            ]
+
+        return profile
 
     async def update_core_user_profile(
         self, user_id: UUID, full_name: str | None = None, **extra_data
@@ -77,9 +95,7 @@ class UserService:
         if not update_data:
             raise ValidationError("No valid fields to update")
 
-        updated_user = await self.user_repo.update(user_id, **update_data)
-        if not updated_user:
-            raise NotFoundError("User", str(user_id))
+        updated_user = await self.user_repo.update_instance(user, **update_data)
 
         return {
             "id": str(updated_user.id),
@@ -188,9 +204,7 @@ class UserService:
         if not update_data:
             raise ValidationError("No valid fields to update")
 
-        for key, value in update_data.items():
-            setattr(user, key, value)
-        await user.save(using_db=conn)
+        user = await self.tenant_user_repo.update_instance(user, using_db=conn, **update_data)
 
         return {
             "id": str(user.id),
@@ -201,6 +215,7 @@ class UserService:
             "is_owner": user.is_owner,
             "is_active": user.is_active,
             "metadata": user.metadata,
+            "created_at": format_datetime(user.created_at),
             "updated_at": format_datetime(user.updated_at),
         }
 
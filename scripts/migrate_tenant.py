@@ -6,7 +6,13 @@ Usage:
 """
 
 import asyncio
+import os
 import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+APPLY_MODULE = "scripts.apply_tenant_migrations"
+DEFAULT_CONCURRENCY = 8
 
 
 async def migrate_tenant(tenant_id: str):
@@ -29,10 +35,59 @@ async def migrate_tenant(tenant_id: str):
         raise Exception(f"Migration failed for tenant {tenant_id}")
 
 
+async def migrate_tenant_isolated(tenant_id: str) -> bool:
+    """
+    Apply migrations to a tenant database in a separate process
+
+    apply_migrations_to_tenant re-initializes the global Tortoise state,
+    so concurrent migrations must not share an interpreter.
+
+    Args:
+        tenant_id: Tenant/organization ID
+
+    Returns:
+        True if successful, False otherwise
+    """
+    print(f"Applying migrations to tenant: {tenant_id}")
+
+    # Run as a module from the project root so the child can import the app package
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", APPLY_MODULE, tenant_id, cwd=PROJECT_ROOT
+    )
+    return_code = await process.wait()
+
+    if return_code == 0:
+        print(f"GOOD: Migrations applied successfully to tenant {tenant_id}")
+        return True
+
+    print(f"BAD: Failed to apply migrations to tenant {tenant_id}")
+    return False
+
+
+def get_migrate_concurrency() -> int:
+    """
+    Read the number of concurrent tenant migrations from MIGRATE_CONCURRENCY
+
+    Raises:
+        ValueError: If the value is not an integer of at least 1
+    """
+    raw_value = os.getenv("MIGRATE_CONCURRENCY", str(DEFAULT_CONCURRENCY))
+    try:
+        concurrency = int(raw_value)
+    except ValueError:
+        concurrency = 0
+    if concurrency < 1:
+        raise ValueError(f"MIGRATE_CONCURRENCY must be an integer >= 1, got {raw_value!r}")
+    return concurrency
+
+
 async def migrate_all_tenants():
     """
     Apply migrations to all existing tenant databases
+    Runs up to MIGRATE_CONCURRENCY (default 8) migrations at a time
     """
+    concurrency = get_migrate_concurrency()
+
     from app.core.database import db_manager
     from app.repositories.organization_repository import OrganizationRepository
 
@@ -45,16 +100,21 @@ async def migrate_all_tenants():
 
     print(f"Found {len(organizations)} organizations")
 
-    for org in organizations:
-        tenant_id = str(org.id)
-        try:
-            await migrate_tenant(tenant_id)
-        except Exception as e:
-            print(f"Failed to migrate tenant {tenant_id}: {e}")
-            continue
-
+    # Only the organization list is needed from the core database
     await db_manager.close_all()
 
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _migrate(tenant_id: str) -> None:
+        async with semaphore:
+            # A failed migration is already reported by migrate_tenant_isolated
+            try:
+                await migrate_tenant_isolated(tenant_id)
+            except Exception as e:
+                print(f"Failed to migrate tenant {tenant_id}: {e}")
+
+    await asyncio.gather(*(_migrate(str(org.id)) for org in organizations))
+
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the whole test suite
+"""
+
+import os
+
+import pytest
+from pytest_asyncio import is_async_test
+
+# Settings are read at import time, so pin the test defaults before any app module loads
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("API_V1_PREFIX", "/api/v1")
+
+_TEST_BCRYPT_ROUNDS = 4
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_bcrypt():
+    from app.core.security import PasswordHasher
+
+    # bcrypt's minimum cost; hashes keep the $2b$ format and still verify
+    default_rounds = PasswordHasher._rounds
+    PasswordHasher._rounds = _TEST_BCRYPT_ROUNDS
+    yield
+    PasswordHasher._rounds = default_rounds
+
+
+def pytest_collection_modifyitems(items):
+    # The ini option only scopes async fixtures; tests need the marker to share the same loop
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for integration tests
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import db_manager
+from app.main import app
+
+_PATCHED_DB_METHODS = ("init_core_db", "close_all", "init_tenant_db")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _patch_db_manager():
+    async def _async_noop(*args, **kwargs):
+        return None
+
+    # monkeypatch is function-scoped; shadow the methods on the instance instead
+    for name in _PATCHED_DB_METHODS:
+        setattr(db_manager, name, _async_noop)
+    yield
+    for name in _PATCHED_DB_METHODS:
+        delattr(db_manager, name)
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
@@ -1,201 +1,129 @@
-from types import SimpleNamespace
+from dataclasses import dataclass
 
 import pytest
-from fastapi.testclient import TestClient
 
 from app.api.v1.users import get_current_user_tenant
-from app.core.database import db_manager
 from app.main import app
 from app.services.auth_service import auth_service
 from app.services.user_service import user_service
 
-
-@pytest.fixture(autouse=True)
-def _patch_db_manager(monkeypatch):
-    async def _async_noop(*args, **kwargs):
-        return None
-
-    monkeypatch.setattr(db_manager, "init_core_db", _async_noop)
-    monkeypatch.setattr(db_manager, "close_all", _async_noop)
-    monkeypatch.setattr(db_manager, "init_tenant_db", _async_noop)
-    yield
-
-
-@pytest.fixture
-def client():
-    with TestClient(app) as test_client:
-        yield test_client
-
-
-def test_register_core_user(client, monkeypatch):
-    async def fake_register_core_user(email, password, full_name=None):
-        return {
-            "user": {
-                "id": "core-user",
-                "email": email,
-                "full_name": full_name,
-                "is_active": True,
-            },
-            "access_token": "token-core",
-            "token_type": "bearer",
-            "scope": "core",
-        }
-
-    monkeypatch.setattr(auth_service, "register_core_user", fake_register_core_user)
+_TENANT_ID = "tenant-123"
+_TENANT_HEADERS = {"X-Tenant-Id": _TENANT_ID}
+
+
+def _make_auth_payload(*, scope, email, full_name=None, tenant_id=None, is_owner=False):
+    user = {"id": f"{scope}-user", "email": email, "full_name": full_name, "is_active": True}
+    if scope == "tenant":
+        user["is_owner"] = is_owner
+    payload = {
+        "user": user,
+        "access_token": f"token-{scope}",
+        "token_type": "bearer",
+        "scope": scope,
+    }
+    if tenant_id is not None:
+        payload["tenant_id"] = tenant_id
+    return payload
+
+
+async def _fake_auth(email, password, tenant_id=None, full_name=None):
+    scope = "tenant" if tenant_id is not None else "core"
+    return _make_auth_payload(scope=scope, email=email, full_name=full_name, tenant_id=tenant_id)
+
+
+async def _fake_get_profile(user_id, tenant_id):
+    return {
+        "id": str(user_id),
+        "email": "tenant@example.com",
+        "full_name": "Tenant",
+        "phone": None,
+        "avatar_url": None,
+        "is_owner": False,
+        "is_active": True,
+        "metadata": {},
+        "created_at": "2025-01-01 00:00:00",
+        "updated_at": "2025-01-01 00:00:00",
+    }
+
+
+async def _fake_update_profile(user_id, tenant_id, **data):
+    assert data["full_name"] == "Updated Tenant"
+    return {
+        "id": str(user_id),
+        "email": "tenant@example.com",
+        "full_name": data["full_name"],
+        "phone": data.get("phone"),
+        "avatar_url": data.get("avatar_url"),
+        "is_owner": False,
+        "is_active": True,
+        "metadata": data.get("metadata", {}),
+        "created_at": "2025-01-01 00:00:00",
+        "updated_at": "2025-01-01 00:00:00",
+    }
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "service_attr", "headers", "status_code", "scope"),
+    [
+        ("/api/v1/auth/register", "register_core_user", {}, 201, "core"),
+        ("/api/v1/auth/register", "register_tenant_user", _TENANT_HEADERS, 201, "tenant"),
+        ("/api/v1/auth/login", "login_core_user", {}, 200, "core"),
+        ("/api/v1/auth/login", "login_tenant_user", _TENANT_HEADERS, 200, "tenant"),
+    ],
+    ids=["register-core", "register-tenant", "login-core", "login-tenant"],
+)
+def test_auth_endpoint(client, monkeypatch, endpoint, service_attr, headers, status_code, scope):
+    monkeypatch.setattr(auth_service, service_attr, _fake_auth)
 
     response = client.post(
-        "/api/v1/auth/register",
-        json={"email": "user@example.com", "password": "secret", "full_name": "User"},
+        endpoint,
+        headers=headers,
+        json={"email": "user@example.com", "password": "secret"},
     )
 
-    assert response.status_code == 201
+    assert response.status_code == status_code
     payload = response.json()
-    assert payload["scope"] == "core"
+    assert payload["scope"] == scope
     assert payload["user"]["email"] == "user@example.com"
+    assert payload.get("tenant_id") == headers.get("X-Tenant-Id")
 
 
-def test_register_tenant_user(client, monkeypatch):
-    async def fake_register_tenant_user(tenant_id, email, password, full_name=None):
-        return {
-            "user": {
-                "id": "tenant-user",
-                "email": email,
-                "full_name": full_name,
-                "is_active": True,
-                "is_owner": False,
-            },
-            "access_token": "token-tenant",
-            "token_type": "bearer",
-            "scope": "tenant",
-            "tenant_id": tenant_id,
-        }
-
-    monkeypatch.setattr(auth_service, "register_tenant_user", fake_register_tenant_user)
+@dataclass(frozen=True, slots=True)
+class _TenantUserStub:
+    id: str
+    email: str
 
-    response = client.post(
-        "/api/v1/auth/register",
-        headers={"X-Tenant-Id": "tenant-123"},
-        json={"email": "tenant@example.com", "password": "secret", "full_name": "Tenant"},
-    )
-
-    assert response.status_code == 201
-    payload = response.json()
-    assert payload["tenant_id"] == "tenant-123"
-    assert payload["scope"] == "tenant"
-
-
-def test_login_core_user(client, monkeypatch):
-    async def fake_login_core_user(email, password):
-        return {
-            "user": {
-                "id": "core-user",
-                "email": email,
-                "full_name": "User",
-                "is_active": True,
-            },
-            "access_token": "token-core",
-            "token_type": "bearer",
-            "scope": "core",
-        }
-
-    monkeypatch.setattr(auth_service, "login_core_user", fake_login_core_user)
-
-    response = client.post(
-        "/api/v1/auth/login",
-        json={"email": "user@example.com", "password": "secret"},
-    )
 
-    assert response.status_code == 200
-    assert response.json()["scope"] == "core"
-
-
-def test_login_tenant_user(client, monkeypatch):
-    async def fake_login_tenant_user(tenant_id, email, password):
-        return {
-            "user": {
-                "id": "tenant-user",
-                "email": email,
-                "full_name": "Tenant",
-                "is_active": True,
-                "is_owner": False,
-            },
-            "access_token": "token-tenant",
-            "token_type": "bearer",
-            "scope": "tenant",
-            "tenant_id": tenant_id,
-        }
-
-    monkeypatch.setattr(auth_service, "login_tenant_user", fake_login_tenant_user)
+_TENANT_USER = _TenantUserStub(id="tenant-user", email="tenant@example.com")
 
-    response = client.post(
-        "/api/v1/auth/login",
-        headers={"X-Tenant-Id": "tenant-123"},
-        json={"email": "tenant@example.com", "password": "secret"},
-    )
 
-    assert response.status_code == 200
-    payload = response.json()
-    assert payload["tenant_id"] == "tenant-123"
+async def _tenant_override():
+    return _TENANT_USER, _TENANT_ID
 
 
 @pytest.fixture
-def tenant_user_override():
-    user = SimpleNamespace(id="tenant-user", email="tenant@example.com")
-
-    async def override():
-        return user, "tenant-123"
-
-    app.dependency_overrides[get_current_user_tenant] = override
-    yield user
-    app.dependency_overrides.pop(get_current_user_tenant, None)
+def tenant_user_override(monkeypatch):
+    # Routes resolve overrides through the original app, so a copied app would be ignored;
+    # setitem restores whatever override was installed before this test
+    monkeypatch.setitem(app.dependency_overrides, get_current_user_tenant, _tenant_override)
+    return _TENANT_USER
 
 
 def test_get_tenant_profile(client, monkeypatch, tenant_user_override):
-    async def fake_get_profile(user_id, tenant_id):
-        return {
-            "id": str(user_id),
-            "email": "tenant@example.com",
-            "full_name": "Tenant",
-            "phone": None,
-            "avatar_url": None,
-            "is_owner": False,
-            "is_active": True,
-            "metadata": {},
-            "created_at": "2025-01-01 00:00:00",
-            "updated_at": "2025-01-01 00:00:00",
-        }
-
-    monkeypatch.setattr(user_service, "get_tenant_user_profile", fake_get_profile)
-
-    response = client.get(
-        "/api/v1/users/me",
-        headers={"X-Tenant-Id": "tenant-123"},
-    )
+    monkeypatch.setattr(user_service, "get_tenant_user_profile", _fake_get_profile)
+
+    response = client.get("/api/v1/users/me", headers=_TENANT_HEADERS)
 
     assert response.status_code == 200
     assert response.json()["email"] == "tenant@example.com"
 
 
 def test_update_tenant_profile(client, monkeypatch, tenant_user_override):
-    async def fake_update_profile(user_id, tenant_id, **data):
-        assert data["full_name"] == "Updated Tenant"
-        return {
-            "id": str(user_id),
-            "email": "tenant@example.com",
-            "full_name": data["full_name"],
-            "phone": data.get("phone"),
-            "avatar_url": data.get("avatar_url"),
-            "is_owner": False,
-            "is_active": True,
-            "metadata": data.get("metadata", {}),
-            "updated_at": "2025-01-01 00:00:00",
-        }
-
-    monkeypatch.setattr(user_service, "update_tenant_user_profile", fake_update_profile)
+    monkeypatch.setattr(user_service, "update_tenant_user_profile", _fake_update_profile)
 
     response = client.put(
         "/api/v1/users/me",
-        headers={"X-Tenant-Id": "tenant-123"},
+        headers=_TENANT_HEADERS,
         json={"full_name": "Updated Tenant", "metadata": {"role": "member"}},
     )
 
@@ -0,0 +1,103 @@
+"""
+Unit tests for the database manager
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import asyncpg
+import pytest
+from tortoise import Tortoise
+
+from app.config import get_settings
+from app.core.database import DatabaseManager, get_tortoise_orm_config
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    # A detached instance, so the shared db_manager singleton keeps its own state
+    manager = object.__new__(DatabaseManager)
+    monkeypatch.setattr(Tortoise, "close_connections", AsyncMock())
+    return manager
+
+
+@pytest.fixture
+def create_pool(monkeypatch):
+    async def _create_pool(**kwargs):
+        # Yield to the loop so concurrent callers overlap the creation
+        await asyncio.sleep(0)
+        return Mock(close=AsyncMock())
+
+    create_pool = AsyncMock(side_effect=_create_pool)
+    monkeypatch.setattr(asyncpg, "create_pool", create_pool)
+    return create_pool
+
+
+async def test_get_admin_pool_reuses_pool(manager, create_pool):
+    """Test the admin pool is created once and then reused"""
+    first = await manager.get_admin_pool()
+    second = await manager.get_admin_pool()
+
+    assert first is second
+    create_pool.assert_awaited_once()
+    assert create_pool.await_args.kwargs["database"] == "postgres"
+
+
+async def test_get_admin_pool_concurrent_first_use(manager, create_pool):
+    """Test concurrent callers on a cold manager share a single pool"""
+    first, second = await asyncio.gather(manager.get_admin_pool(), manager.get_admin_pool())
+
+    assert first is second
+    create_pool.assert_awaited_once()
+
+
+def test_get_admin_pool_concurrent_first_use_on_separate_loops(manager, create_pool):
+    """Test concurrent first use works again on a new loop after close_all"""
+
+    async def _lifecycle():
+        first, second = await asyncio.gather(manager.get_admin_pool(), manager.get_admin_pool())
+        assert first is second
+        await manager.close_all()
+
+    # Private loops rather than asyncio.run, which would unset the session loop
+    for _ in range(2):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(_lifecycle())
+        finally:
+            loop.close()
+
+    assert create_pool.await_count == 2
+
+
+async def test_close_all_closes_admin_pool(manager, create_pool):
+    """Test close_all closes the admin pool and a later call creates a new one"""
+    pool = await manager.get_admin_pool()
+
+    await manager.close_all()
+
+    pool.close.assert_awaited_once()
+    assert manager._admin_pool is None
+    assert await manager.get_admin_pool() is not pool
+    assert create_pool.await_count == 2
+
+
+def test_get_tortoise_orm_config_returns_copy():
+    """Test callers cannot mutate the shared config"""
+    config = get_tortoise_orm_config()
+    config["connections"]["default"] = "sqlite://:memory:"
+
+    assert get_tortoise_orm_config()["connections"]["default"] != "sqlite://:memory:"
+
+
+def test_get_tortoise_orm_config_follows_settings(monkeypatch):
+    """Test a settings refresh is picked up without clearing the config cache"""
+    monkeypatch.setenv("CORE_DB_NAME", "refreshed_core")
+    get_settings.cache_clear()
+    try:
+        config = get_tortoise_orm_config()
+    finally:
+        monkeypatch.undo()
+        get_settings.cache_clear()
+
+    assert config["connections"]["default"].endswith("/refreshed_core")
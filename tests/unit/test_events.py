@@ -0,0 +1,64 @@
+"""
+Unit tests for the event emitter
+"""
+
+import asyncio
+
+from app.events.emitter import EventEmitter
+
+
+async def test_emit_in_background_tracks_task_until_done():
+    """Test a background emit runs its handler and is untracked once finished"""
+    emitter = EventEmitter()
+    received = []
+    release = asyncio.Event()
+
+    async def handler(data):
+        await release.wait()
+        received.append(data)
+
+    emitter.on("test.event", handler)
+
+    task = emitter.emit_in_background("test.event", {"id": 1})
+
+    assert task in emitter._pending_tasks
+
+    release.set()
+    await task
+
+    assert received == [{"id": 1}]
+    assert task not in emitter._pending_tasks
+
+
+async def test_drain_waits_for_pending_tasks():
+    """Test drain lets in-flight handlers complete"""
+    emitter = EventEmitter()
+    received = []
+
+    async def handler(data):
+        await asyncio.sleep(0)
+        received.append(data)
+
+    emitter.on("test.event", handler)
+    emitter.emit_in_background("test.event", {"id": 1})
+
+    await emitter.drain(timeout=1)
+
+    assert received == [{"id": 1}]
+    assert not emitter._pending_tasks
+
+
+async def test_drain_cancels_tasks_after_timeout():
+    """Test drain cancels handlers that outlive the timeout"""
+    emitter = EventEmitter()
+
+    async def handler(data):
+        await asyncio.Event().wait()
+
+    emitter.on("test.event", handler)
+    task = emitter.emit_in_background("test.event")
+
+    await emitter.drain(timeout=0.01)
+
+    assert task.cancelled()
+    assert not emitter._pending_tasks
@@ -2,6 +2,7 @@
 Unit tests for custom exceptions
 """
 
+import pytest
 from fastapi import status
 
 from app.core.exceptions import (
@@ -16,71 +17,54 @@ from app.core.exceptions import (
     ValidationError,
 )
 
+EXCEPTION_CASES = [
+    (NotFoundError, ("User", "123"), status.HTTP_404_NOT_FOUND, "User not found with id: 123"),
+    (
+        ValidationError,
+        ("Invalid input",),
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        "Invalid input",
+    ),
+    (
+        AuthenticationError,
+        ("Invalid credentials",),
+        status.HTTP_401_UNAUTHORIZED,
+        "Invalid credentials",
+    ),
+    (AuthorizationError, ("Access denied",), status.HTTP_403_FORBIDDEN, "Access denied"),
+    (TenantNotFoundError, ("123",), status.HTTP_404_NOT_FOUND, "Tenant not found: 123"),
+    (TenantAccessError, ("123",), status.HTTP_403_FORBIDDEN, "Access denied to tenant: 123"),
+    (
+        DatabaseError,
+        ("Connection failed",),
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "Connection failed",
+    ),
+    (
+        ConflictError,
+        ("Resource already exists",),
+        status.HTTP_409_CONFLICT,
+        "Resource already exists",
+    ),
+    (BadRequestError, ("Invalid request",), status.HTTP_400_BAD_REQUEST, "Invalid request"),
+]
+
+
+@pytest.mark.parametrize(
+    ("exc_cls", "args", "status_code", "detail"),
+    EXCEPTION_CASES,
+    ids=[case[0].__name__ for case in EXCEPTION_CASES],
+)
+def test_exception(exc_cls, args, status_code, detail):
+    """Test exception status code and detail"""
+    error = exc_cls(*args)
 
-class TestExceptions:
-    """Tests for custom exceptions"""
-
-    def test_not_found_error(self):
-        """Test NotFoundError"""
-        error = NotFoundError("User", "123")
-
-        assert error.status_code == status.HTTP_404_NOT_FOUND
-        assert "User" in error.detail
-        assert "123" in error.detail
-
-    def test_validation_error(self):
-        """Test ValidationError"""
-        error = ValidationError("Invalid input")
-
-        assert error.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-        assert error.detail == "Invalid input"
-
-    def test_authentication_error(self):
-        """Test AuthenticationError"""
-        error = AuthenticationError("Invalid credentials")
-
-        assert error.status_code == status.HTTP_401_UNAUTHORIZED
-        assert error.detail == "Invalid credentials"
-        assert "WWW-Authenticate" in error.headers
-
-    def test_authorization_error(self):
-        """Test AuthorizationError"""
-        error = AuthorizationError("Access denied")
-
-        assert error.status_code == status.HTTP_403_FORBIDDEN
-        assert error.detail == "Access denied"
-
-    def test_tenant_not_found_error(self):
-        """Test TenantNotFoundError"""
-        error = TenantNotFoundError("123")
-
-        assert error.status_code == status.HTTP_404_NOT_FOUND
-        assert "123" in error.detail
-
-    def test_tenant_access_error(self):
-        """Test TenantAccessError"""
-        error = TenantAccessError("123")
-
-        assert error.status_code == status.HTTP_403_FORBIDDEN
-        assert "123" in error.detail
-
-    def test_database_error(self):
-        """Test DatabaseError"""
-        error = DatabaseError("Connection failed")
-
-        assert error.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        assert error.detail == "Connection failed"
-
-    def test_conflict_error(self):
-        """Test ConflictError"""
-        error = ConflictError("Resource already exists")
+    assert error.status_code == status_code
+    assert error.detail == detail
 
-        assert error.status_code == status.HTTP_409_CONFLICT
-        assert error.detail == "Resource already exists"
 
-    def test_bad_request_error(self):
-        """Test BadRequestError"""
-        error = BadRequestError("Invalid request")
+def test_authentication_error_headers():
+    """Test AuthenticationError asks for bearer credentials"""
+    error = AuthenticationError("Invalid credentials")
 
-        assert error.status_code == status.HTTP_400_BAD_REQUEST
-        assert error.detail == "Invalid request"
+    assert "WWW-Authenticate" in error.headers
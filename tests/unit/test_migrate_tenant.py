@@ -0,0 +1,72 @@
+"""
+Unit tests for the tenant migration script
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.database import db_manager
+from app.repositories.organization_repository import OrganizationRepository
+from scripts import migrate_tenant
+
+
+@pytest.mark.parametrize("raw_value", ["0", "-1", "two", "1.5", ""])
+def test_get_migrate_concurrency_rejects_invalid(monkeypatch, raw_value):
+    """Test concurrency must be an integer of at least 1"""
+    monkeypatch.setenv("MIGRATE_CONCURRENCY", raw_value)
+
+    with pytest.raises(ValueError, match="MIGRATE_CONCURRENCY"):
+        migrate_tenant.get_migrate_concurrency()
+
+
+def test_get_migrate_concurrency(monkeypatch):
+    """Test concurrency is read from the environment with a default"""
+    monkeypatch.delenv("MIGRATE_CONCURRENCY", raising=False)
+    assert migrate_tenant.get_migrate_concurrency() == migrate_tenant.DEFAULT_CONCURRENCY
+
+    monkeypatch.setenv("MIGRATE_CONCURRENCY", "3")
+    assert migrate_tenant.get_migrate_concurrency() == 3
+
+
+async def test_migrate_all_tenants_bounded(monkeypatch, capsys):
+    """Test tenants migrate in subprocesses, at most MIGRATE_CONCURRENCY at a time"""
+    tenant_ids = ["1", "2", "3", "4", "5"]
+    running = 0
+    peak = 0
+    spawned = []
+
+    async def _create_subprocess_exec(*args, **kwargs):
+        tenant_id = args[-1]
+        spawned.append(tenant_id)
+
+        async def _wait():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Yield so the other tenants get a chance to start
+            await asyncio.sleep(0)
+            running -= 1
+            return 1 if tenant_id == "3" else 0
+
+        return SimpleNamespace(wait=_wait)
+
+    monkeypatch.setenv("MIGRATE_CONCURRENCY", "2")
+    monkeypatch.setattr(db_manager, "init_core_db", AsyncMock())
+    monkeypatch.setattr(db_manager, "close_all", AsyncMock())
+    monkeypatch.setattr(
+        OrganizationRepository,
+        "get_all",
+        AsyncMock(return_value=[SimpleNamespace(id=tenant_id) for tenant_id in tenant_ids]),
+    )
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _create_subprocess_exec)
+
+    await migrate_tenant.migrate_all_tenants()
+
+    assert sorted(spawned) == tenant_ids
+    assert peak == 2
+    output = capsys.readouterr().out
+    assert output.count("Failed to apply migrations to tenant 3") == 1
+    assert "Failed to migrate tenant" not in output
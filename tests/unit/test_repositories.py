@@ -0,0 +1,48 @@
+"""
+Unit tests for the base repository
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.repositories.base import BaseRepository
+
+
+def _make_instance(*fields):
+    return SimpleNamespace(
+        _meta=SimpleNamespace(fields_map=dict.fromkeys(fields)),
+        update_from_dict=AsyncMock(),
+        save=AsyncMock(),
+    )
+
+
+@pytest.mark.parametrize(
+    ("data", "update_fields"),
+    [
+        ({"full_name": "New"}, ["full_name", "updated_at"]),
+        ({"full_name": "New", "unknown": 1}, ["full_name", "updated_at"]),
+        ({"full_name": "New", "updated_at": None}, ["full_name", "updated_at"]),
+    ],
+    ids=["changed-field", "unknown-field-dropped", "updated-at-listed-once"],
+)
+async def test_update_instance_saves_only_changed_fields(data, update_fields):
+    """Test update_instance writes the changed columns plus updated_at"""
+    instance = _make_instance("full_name", "updated_at")
+    conn = Mock()
+
+    result = await BaseRepository(Mock()).update_instance(instance, using_db=conn, **data)
+
+    assert result is instance
+    instance.update_from_dict.assert_awaited_once_with(data)
+    instance.save.assert_awaited_once_with(using_db=conn, update_fields=update_fields)
+
+
+async def test_update_instance_without_updated_at_field():
+    """Test update_instance does not add updated_at to models without it"""
+    instance = _make_instance("name")
+
+    await BaseRepository(Mock()).update_instance(instance, name="New")
+
+    instance.save.assert_awaited_once_with(using_db=None, update_fields=["name"])
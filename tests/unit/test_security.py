@@ -2,10 +2,14 @@
 Unit tests for security utilities
 """
 
-from uuid import uuid4
+import time
+from collections import OrderedDict
+from uuid import UUID
 
 import pytest
+from jose import jwt
 
+from app.core import security
 from app.core.exceptions import AuthenticationError, ValidationError
 from app.core.security import (
     JWTHandler,
@@ -15,6 +19,14 @@ from app.core.security import (
     create_tenant_token,
 )
 
+TEST_USER_ID = UUID("12345678-1234-5678-1234-567812345678")
+TEST_PASSWORD = "testpassword123"
+
+
+@pytest.fixture(scope="class")
+def sample_hash():
+    return PasswordHasher.hash_password(TEST_PASSWORD)
+
 
 class TestPasswordHasher:
     """Tests for password hashing"""
@@ -28,20 +40,13 @@ class TestPasswordHasher:
         assert len(hashed) > 0
         assert hashed.startswith("$2b$")  # bcrypt format
 
-    def test_verify_password_correct(self):
+    def test_verify_password_correct(self, sample_hash):
         """Test password verification with correct password"""
-        password = "testpassword123"
-        hashed = PasswordHasher.hash_password(password)
-
-        assert PasswordHasher.verify_password(password, hashed) is True
+        assert PasswordHasher.verify_password(TEST_PASSWORD, sample_hash) is True
 
-    def test_verify_password_incorrect(self):
+    def test_verify_password_incorrect(self, sample_hash):
         """Test password verification with incorrect password"""
-        password = "testpassword123"
-        wrong_password = "wrongpassword"
-        hashed = PasswordHasher.hash_password(password)
-
-        assert PasswordHasher.verify_password(wrong_password, hashed) is False
+        assert PasswordHasher.verify_password("wrongpassword", sample_hash) is False
 
     def test_hash_password_different_hashes(self):
         """Test that same password produces different hashes (due to salt)"""
@@ -51,45 +56,34 @@ class TestPasswordHasher:
 
         # Hashes should be different (bcrypt uses random salt)
         assert hashed1 != hashed2
-        # But both should verify correctly
-        assert PasswordHasher.verify_password(password, hashed1) is True
-        assert PasswordHasher.verify_password(password, hashed2) is True
 
 
 class TestJWTHandler:
     """Tests for JWT token handling"""
 
-    def test_create_core_token(self):
-        """Test creating token for core user"""
-        user_id = uuid4()
-        email = "test@example.com"
-
-        token = JWTHandler.create_token_for_core_user(user_id, email)
+    @pytest.mark.parametrize(
+        ("create_token", "args"),
+        [
+            (JWTHandler.create_token_for_core_user, ()),
+            (JWTHandler.create_token_for_tenant_user, ("123",)),
+        ],
+        ids=["core", "tenant"],
+    )
+    def test_create_token(self, create_token, args):
+        """Test creating token for core and tenant users"""
+        token = create_token(TEST_USER_ID, "test@example.com", *args)
 
-        assert token is not None
         assert isinstance(token, str)
         assert len(token) > 0
 
-    def test_create_tenant_token(self):
-        """Test creating token for tenant user"""
-        user_id = uuid4()
-        email = "test@example.com"
-        tenant_id = "123"
-
-        token = JWTHandler.create_token_for_tenant_user(user_id, email, tenant_id)
-
-        assert token is not None
-        assert isinstance(token, str)
-
     def test_decode_token_core(self):
         """Test decoding core token"""
-        user_id = uuid4()
         email = "test@example.com"
-        token = create_core_token(user_id, email)
+        token = create_core_token(TEST_USER_ID, email)
 
         payload = JWTHandler.decode_token(token)
 
-        assert payload["user_id"] == str(user_id)
+        assert payload["user_id"] == str(TEST_USER_ID)
         assert payload["email"] == email
         assert payload["scope"] == TokenScope.CORE
         assert payload["tenant_id"] is None
@@ -98,14 +92,13 @@ class TestJWTHandler:
 
     def test_decode_token_tenant(self):
         """Test decoding tenant token"""
-        user_id = uuid4()
         email = "test@example.com"
         tenant_id = "123"
-        token = create_tenant_token(user_id, email, tenant_id)
+        token = create_tenant_token(TEST_USER_ID, email, tenant_id)
 
         payload = JWTHandler.decode_token(token)
 
-        assert payload["user_id"] == str(user_id)
+        assert payload["user_id"] == str(TEST_USER_ID)
         assert payload["email"] == email
         assert payload["scope"] == TokenScope.TENANT
         assert payload["tenant_id"] == tenant_id
@@ -117,47 +110,75 @@ class TestJWTHandler:
         with pytest.raises(AuthenticationError):
             JWTHandler.decode_token(invalid_token)
 
-    def test_extract_user_id(self):
-        """Test extracting user_id from payload"""
-        user_id = uuid4()
-        payload = {"user_id": str(user_id)}
+    def test_decode_token_cached(self, monkeypatch):
+        """Test decoding the same token twice verifies it only once"""
+        monkeypatch.setattr(security, "_verified_tokens", OrderedDict())
+        calls = []
+        real_decode = jwt.decode
 
-        extracted = JWTHandler.extract_user_id(payload)
+        def counting_decode(*args, **kwargs):
+            calls.append(args[0])
+            return real_decode(*args, **kwargs)
 
-        assert extracted == user_id
+        monkeypatch.setattr(jwt, "decode", counting_decode)
+        token = create_core_token(TEST_USER_ID, "test@example.com")
 
-    def test_extract_user_id_missing(self):
-        """Test extracting user_id when missing raises exception"""
-        payload = {}
+        first = JWTHandler.decode_token(token)
+        first["email"] = "changed@example.com"
+        second = JWTHandler.decode_token(token)
 
-        with pytest.raises(ValidationError):
-            JWTHandler.extract_user_id(payload)
-
-    def test_extract_email(self):
-        """Test extracting email from payload"""
-        email = "test@example.com"
-        payload = {"email": email}
+        assert len(calls) == 1
+        assert second["email"] == "test@example.com"
 
-        extracted = JWTHandler.extract_email(payload)
+    def test_decode_token_cache_bounded(self, monkeypatch):
+        """Test the cache holds token digests only and evicts the oldest entry"""
+        monkeypatch.setattr(security, "_verified_tokens", OrderedDict())
+        monkeypatch.setattr(security, "_VERIFIED_TOKENS_MAX", 1)
+        first = create_core_token(TEST_USER_ID, "first@example.com")
+        second = create_core_token(TEST_USER_ID, "second@example.com")
 
-        assert extracted == email
+        JWTHandler.decode_token(first)
+        JWTHandler.decode_token(second)
 
-    def test_extract_scope(self):
-        """Test extracting scope from payload"""
-        payload = {"scope": TokenScope.CORE}
+        (key,) = security._verified_tokens
+        assert len(key) == 16
+        assert security._verified_tokens[key]["email"] == "second@example.com"
 
-        extracted = JWTHandler.extract_scope(payload)
-
-        assert extracted == TokenScope.CORE
-
-    def test_extract_tenant_id(self):
-        """Test extracting tenant_id from payload"""
-        tenant_id = "123"
-        payload = {"tenant_id": tenant_id}
+    def test_decode_token_cached_expired(self, monkeypatch):
+        """Test a cached token is rejected once it expires"""
+        token = create_core_token(TEST_USER_ID, "test@example.com")
+        payload = JWTHandler.decode_token(token)
 
-        extracted = JWTHandler.extract_tenant_id(payload)
+        monkeypatch.setattr(time, "time", lambda: payload["exp"] + 1)
 
-        assert extracted == tenant_id
+        with pytest.raises(AuthenticationError):
+            JWTHandler.decode_token(token)
+
+    @pytest.mark.parametrize(
+        ("extract", "field", "value"),
+        [
+            (JWTHandler.extract_user_id, "user_id", TEST_USER_ID),
+            (JWTHandler.extract_email, "email", "test@example.com"),
+            (JWTHandler.extract_scope, "scope", TokenScope.CORE),
+            (JWTHandler.extract_tenant_id, "tenant_id", "123"),
+        ],
+        ids=["user_id", "email", "scope", "tenant_id"],
+    )
+    def test_extract(self, extract, field, value):
+        """Test extracting a claim from payload"""
+        payload = {field: str(value)}
+
+        assert extract(payload) == value
+
+    @pytest.mark.parametrize(
+        "extract",
+        [JWTHandler.extract_user_id, JWTHandler.extract_email, JWTHandler.extract_scope],
+        ids=["user_id", "email", "scope"],
+    )
+    def test_extract_missing(self, extract):
+        """Test extracting a required claim when missing raises exception"""
+        with pytest.raises(ValidationError):
+            extract({})
 
     def test_validate_token_scope_core(self):
         """Test validating core token scope"""
@@ -3,51 +3,61 @@ Unit tests for tenant manager
 """
 
 import pytest
+from fastapi import HTTPException
 
 from app.core.tenant_manager import TenantContext
 
 
-class TestTenantContext:
-    """Tests for TenantContext"""
+@pytest.fixture(autouse=True)
+def _clean_tenant():
+    # Every test starts and ends without a tenant, whatever ran before it
+    TenantContext.clear_tenant()
+    yield
+    TenantContext.clear_tenant()
 
-    def test_set_and_get_tenant(self):
-        """Test setting and getting tenant"""
-        TenantContext.set_tenant("123")
 
-        tenant_id = TenantContext.get_tenant()
+def test_set_and_get_tenant():
+    """Test setting and getting tenant"""
+    TenantContext.set_tenant("123")
 
-        assert tenant_id == "123"
+    tenant_id = TenantContext.get_tenant()
 
-    def test_clear_tenant(self):
-        """Test clearing tenant"""
-        TenantContext.set_tenant("123")
-        TenantContext.clear_tenant()
+    assert tenant_id == "123"
 
-        tenant_id = TenantContext.get_tenant()
 
-        assert tenant_id is None
+def test_clear_tenant():
+    """Test clearing tenant"""
+    TenantContext.set_tenant("123")
+    TenantContext.clear_tenant()
 
-    def test_is_tenant_context(self):
-        """Test checking tenant context"""
-        TenantContext.set_tenant("123")
+    tenant_id = TenantContext.get_tenant()
 
-        assert TenantContext.is_tenant_context() is True
+    assert tenant_id is None
 
-        TenantContext.clear_tenant()
 
-        assert TenantContext.is_tenant_context() is False
+def test_is_tenant_context():
+    """Test checking tenant context"""
+    TenantContext.set_tenant("123")
 
-    def test_require_tenant_with_tenant(self):
-        """Test require_tenant when tenant is set"""
-        TenantContext.set_tenant("123")
+    assert TenantContext.is_tenant_context() is True
 
-        tenant_id = TenantContext.require_tenant()
+    TenantContext.clear_tenant()
 
-        assert tenant_id == "123"
+    assert TenantContext.is_tenant_context() is False
 
-    def test_require_tenant_without_tenant(self):
-        """Test require_tenant when tenant is not set"""
-        TenantContext.clear_tenant()
 
-        with pytest.raises(Exception):  # HTTPException
-            TenantContext.require_tenant()
+def test_require_tenant_with_tenant():
+    """Test require_tenant when tenant is set"""
+    TenantContext.set_tenant("123")
+
+    tenant_id = TenantContext.require_tenant()
+
+    assert tenant_id == "123"
+
+
+def test_require_tenant_without_tenant():
+    """Test require_tenant when tenant is not set"""
+    with pytest.raises(HTTPException) as exc_info:
+        TenantContext.require_tenant()
+
+    assert exc_info.value.status_code == 400